@@ -5,9 +5,20 @@ Bulk Postgres upsert and update functions:
 - Use [pgbulk.update][] to do a bulk `UPDATE` statement.
 - Use [pgbulk.copy][] to do a `COPY FROM` statement.
 - Use [pgbulk.aupsert][], [pgbulk.aupdate][], or [pgbulk.acopy][] for async versions.
+- Use [pgbulk.pipeline][] to pipeline several calls over one connection.
 """
 
-from pgbulk.core import UpdateField, UpsertResult, acopy, aupdate, aupsert, copy, update, upsert
+from pgbulk.core import (
+    UpdateField,
+    UpsertResult,
+    acopy,
+    aupdate,
+    aupsert,
+    copy,
+    pipeline,
+    update,
+    upsert,
+)
 from pgbulk.version import __version__
 
 __all__ = [
@@ -17,6 +28,7 @@ __all__ = [
     "copy",
     "upsert",
     "aupsert",
+    "pipeline",
     "UpsertResult",
     "UpdateField",
     "__version__",
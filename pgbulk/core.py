@@ -1,5 +1,9 @@
-import itertools
+import collections
+import contextlib
+import functools
+import operator
 import re
+import weakref
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -18,7 +22,7 @@ from typing import (
 from asgiref.sync import sync_to_async
 from django import __version__ as DJANGO_VERSION
 from django.core.exceptions import ImproperlyConfigured
-from django.db import connections, models
+from django.db import DEFAULT_DB_ALIAS, IntegrityError, connections, models, transaction
 from django.db.models import expressions
 from django.db.models.sql.compiler import SQLCompiler
 from django.utils import timezone
@@ -37,13 +41,21 @@ Expression: "TypeAlias" = "models.Expression | models.F"
 
 _PRECISION_SPECIFIER_RE: "Final" = re.compile(r"\(.*?\)")
 
+# The number of rows above which `use_copy="auto"` switches an upsert to the
+# COPY-based path.
+_COPY_UPSERT_THRESHOLD: "Final" = 5000
+
+# The number of rows at or below which non-returning statements may be sent
+# as a batch of per-row statements instead of one large statement.
+_ROW_BATCH_THRESHOLD: "Final" = 100
+
 
 class _DB_DEFAULT:
     """Sentinel value for a database default."""
 
 
 if TYPE_CHECKING:
-    from django.db import DefaultConnectionProxy
+    from django.db.backends.base.base import BaseDatabaseWrapper
     from django.db.backends.utils import CursorWrapper
 
     class Row(NamedTuple):
@@ -76,10 +88,20 @@ psycopg_maj_version = psycopg_version[0]
 
 
 if psycopg_maj_version == 2:
+    from psycopg2.errors import UniqueViolation  # type: ignore
     from psycopg2.extensions import quote_ident  # type: ignore
+    from psycopg2.extras import execute_batch  # type: ignore
+
+    def _quote_ident(field: str, cursor: "CursorWrapper") -> str:
+        return quote_ident(field, cursor.connection)  # type: ignore
+
+    def _register_literal_dumper(cursor: "CursorWrapper") -> None:
+        pass
+
 elif psycopg_maj_version == 3:
     import psycopg.adapt  # type: ignore
-    from psycopg.pq import Escaping  # type: ignore
+    from psycopg.errors import UniqueViolation  # type: ignore
+    from psycopg.pq import Escaping, Format  # type: ignore
 
     class LiteralValue:  # pragma: no cover
         def __init__(self, val: str) -> None:
@@ -92,6 +114,16 @@ elif psycopg_maj_version == 3:
         def quote(self, obj: Any) -> bytes:
             return self.dump(obj)
 
+    def _quote_ident(field: str, cursor: "CursorWrapper") -> str:
+        return (
+            Escaping(cursor.connection.pgconn)  # type: ignore
+            .escape_identifier(field.encode())
+            .decode()
+        )
+
+    def _register_literal_dumper(cursor: "CursorWrapper") -> None:
+        cursor.adapters.register_dumper(LiteralValue, LiteralDumper)  # type: ignore
+
 else:
     raise AssertionError
 
@@ -137,27 +169,64 @@ class UpsertResult(List["Row"]):
     Also provides properties to access created and updated rows.
     """
 
+    _created: Union[List["Row"], None] = None
+    _updated: Union[List["Row"], None] = None
+
+    def _partition(self) -> None:
+        """Split rows by status in one pass, caching both partitions."""
+        created: List["Row"] = []
+        updated: List["Row"] = []
+        for row in self:
+            (created if row.status_ == "c" else updated).append(row)
+
+        self._created = created
+        self._updated = updated
+
     @property
     def created(self) -> List["Row"]:
         """Return the created rows"""
-        return [i for i in self if i.status_ == "c"]
+        if self._created is None:
+            self._partition()
+
+        return cast(List["Row"], self._created)
 
     @property
     def updated(self) -> List["Row"]:
         """Return the updated rows"""
-        return [i for i in self if i.status_ == "u"]
+        if self._updated is None:
+            self._partition()
+
+        return cast(List["Row"], self._updated)
+
+
+_quoted_identifiers: "weakref.WeakKeyDictionary[Any, dict[str, str]]" = weakref.WeakKeyDictionary()
 
 
 def _quote(field: str, cursor: "CursorWrapper") -> str:
-    """Quote identifiers."""
-    if psycopg_maj_version == 2:
-        return quote_ident(field, cursor.connection)  # type: ignore
-    else:
-        return (
-            Escaping(cursor.connection.pgconn)  # type: ignore
-            .escape_identifier(field.encode())
-            .decode()
-        )
+    """Quote identifiers, caching results per connection.
+
+    Keyed weakly on the connection so cached identifiers are discarded
+    when the connection is garbage collected.
+    """
+    cache = _quoted_identifiers.setdefault(cursor.connection, {})
+    quoted = cache.get(field)
+
+    if quoted is None:
+        quoted = cache[field] = _quote_ident(field, cursor)
+
+    return quoted
+
+
+@functools.lru_cache(maxsize=None)
+def _fields_by_name(model: Type[models.Model]) -> "dict[str, AnyField]":
+    """Map both attribute names and field names to fields, cached per model."""
+    fields: "dict[str, AnyField]" = {}
+    for field in _model_fields(model):
+        fields[field.attname] = field
+        if field.name != field.attname:
+            fields[field.name] = field
+
+    return fields
 
 
 def _filter_fields(
@@ -174,14 +243,10 @@ def _filter_fields(
     """
     exclude = exclude or []
     model = queryset.model
-    model_fields = _model_fields(model)
-    all_fields = {
-        **{field.attname: field for field in model_fields},
-        **{field.name: field for field in model_fields},
-    }
+    all_fields = _fields_by_name(model)
 
     if fields is None:
-        fields = [field.attname for field in model_fields]
+        fields = [field.attname for field in _model_fields(model)]
 
     to_update = [
         attname
@@ -202,7 +267,7 @@ def _filter_fields(
     return to_update
 
 
-def _fill_auto_fields(queryset: models.QuerySet[_M], values: Iterable[_M]) -> Iterable[_M]:
+def _fill_auto_fields(queryset: models.QuerySet[_M], values: List[_M]) -> List[_M]:
     """
     Given a list of models, fill in auto_now and auto_now_add fields
     for upserts. Since django manager utils passes Django's ORM, these values
@@ -215,8 +280,8 @@ def _fill_auto_fields(queryset: models.QuerySet[_M], values: Iterable[_M]) -> It
         if getattr(f, "auto_now", False) or getattr(f, "auto_now_add", False)
     ]
     now = timezone.now()
-    for value in values:
-        for f in auto_field_names:
+    for f in auto_field_names:
+        for value in values:
             setattr(value, f, now)
 
     return values
@@ -227,21 +292,33 @@ def _prep_sql_args(
     cursor: "CursorWrapper",
     sql_args: List[Any],
 ) -> List[Any]:
-    if psycopg_maj_version == 3:
-        cursor.adapters.register_dumper(LiteralValue, LiteralDumper)  # type: ignore
+    # The common case has no expressions, so skip the compiler and dumper
+    # registration entirely.
+    if not any(hasattr(sql_arg, "as_sql") for sql_arg in sql_args):
+        return sql_args
+
+    _register_literal_dumper(cursor)
 
+    # Expressions render against the backend wrapper, not the raw driver
+    # connection exposed by the cursor
+    connection = connections[queryset.db]
     compiler = SQLCompiler(
         query=queryset.query,
-        connection=cursor.connection,
+        connection=connection,  # type: ignore
         using=queryset.using,  # type: ignore
     )
 
-    return [
-        LiteralValue(cursor.mogrify(*sql_arg.as_sql(compiler, cursor.connection)).decode("utf-8"))
-        if hasattr(sql_arg, "as_sql")
-        else sql_arg
-        for sql_arg in sql_args
-    ]
+    prepped: List[Any] = []
+    for sql_arg in sql_args:
+        if hasattr(sql_arg, "as_sql"):
+            val = cursor.mogrify(*sql_arg.as_sql(compiler, connection))
+            val = cast(Union[str, bytes], val)
+            if isinstance(val, bytes):  # Psycopg 2/3 return different types
+                val = val.decode("utf-8")
+            sql_arg = LiteralValue(val)
+        prepped.append(sql_arg)
+
+    return prepped
 
 
 def _value_is_db_default(value: Any) -> bool:
@@ -253,7 +330,7 @@ def _get_field_db_val(
     queryset: models.QuerySet[_M],
     field: AnyField,
     value: Any,
-    connection: "DefaultConnectionProxy",
+    connection: "BaseDatabaseWrapper",
     *,
     copying: bool = False,
 ) -> "Any | type[_DB_DEFAULT]":
@@ -280,6 +357,7 @@ def _sort_by_unique_fields(
     queryset: models.QuerySet[_M],
     model_objs: Iterable[_M],
     unique_fields: List[str],
+    connection: "BaseDatabaseWrapper",
 ) -> List[_M]:
     """
     Sort a list of models by their unique fields.
@@ -288,8 +366,20 @@ def _sort_by_unique_fields(
     when doing concurrent upserts
     """
     model = queryset.model
-    connection = connections[queryset.db]
     unique_db_fields = [field for field in _model_fields(model) if field.attname in unique_fields]
+    model_objs = list(model_objs)
+
+    # Any consistent ordering avoids deadlocks, so prefer a C-level sort on
+    # the raw attribute values and only convert values through the ORM when
+    # they aren't directly comparable (e.g. None or timezone objects).
+    if unique_db_fields:
+        try:
+            return sorted(
+                model_objs,
+                key=operator.attrgetter(*[field.attname for field in unique_db_fields]),
+            )
+        except TypeError:
+            pass
 
     def sort_key(model_obj: _M) -> Tuple[Any, ...]:
         return tuple(
@@ -304,10 +394,10 @@ def _get_values_for_row(
     queryset: models.QuerySet[_M],
     model_obj: _M,
     all_fields: List[AnyField],
+    connection: "BaseDatabaseWrapper",
     *,
     copying: bool = False,
 ) -> List[Any]:
-    connection = connections[queryset.db]
     return [
         # Convert field value to db value
         # Use attname here to support fields with custom db_column names
@@ -325,7 +415,7 @@ def _get_values_for_row(
 def _format_placeholders_row(
     values_for_row: List[Any],
     all_fields: List[AnyField],
-    connection: "DefaultConnectionProxy",
+    connection: "BaseDatabaseWrapper",
     *,
     include_cast: bool,
 ) -> str:
@@ -338,33 +428,128 @@ def _format_placeholders_row(
     return f"({placeholders})"
 
 
+def _unnest_db_types(
+    all_fields: List[AnyField],
+    connection: "BaseDatabaseWrapper",
+) -> Union[List[str], None]:
+    """Return the array cast types for an `unnest` source table.
+
+    Returns `None` when a field cannot be passed through `unnest`, such as
+    array columns whose nested values would be flattened.
+    """
+    db_types = [field.db_type(connection) for field in all_fields]
+    if any(db_type is None or "[]" in db_type for db_type in db_types):
+        return None
+
+    return cast(List[str], db_types)
+
+
+def _get_value_cols(
+    model_objs: List[_M],
+    all_fields: List[AnyField],
+    connection: "BaseDatabaseWrapper",
+) -> Union[List[List[Any]], None]:
+    """Adapt row values column-major, returning one list of db values per field.
+
+    Fetching the bound `get_db_prep_save` once per field avoids a Python
+    function call per cell. Returns `None` when a value needs special casing
+    (database defaults or expressions) and rows must be rendered individually.
+    """
+    cols: List[List[Any]] = []
+    for field in all_fields:
+        prep = field.get_db_prep_save
+        col = [getattr(model_obj, field.attname) for model_obj in model_objs]
+        if any(hasattr(value, "resolve_expression") for value in col):
+            return None
+
+        cols.append([prep(value, connection) for value in col])
+
+    return cols
+
+
 def _get_values_for_rows(
     queryset: models.QuerySet[_M],
-    model_objs: Iterable[_M],
+    model_objs: List[_M],
     all_fields: List[AnyField],
-) -> Tuple[List[str], List[Any]]:
-    connection = connections[queryset.db]
-    row_values: List[str] = []
-    sql_args: List[Any] = []
+    connection: "BaseDatabaseWrapper",
+) -> Tuple[str, List[Any]]:
+    """Render the row values of an upsert or update as SQL with its args.
 
-    for i, model_obj in enumerate(model_objs):
-        values_for_row = _get_values_for_row(queryset, model_obj, all_fields)
-        sql_args.extend((val for val in values_for_row if val is not _DB_DEFAULT))
-        if i == 0:
-            row_values.append(
-                _format_placeholders_row(values_for_row, all_fields, connection, include_cast=True)  # type: ignore
-            )
-        else:
+    Rows are normally passed as one array parameter per column through a
+    single `SELECT * FROM UNNEST(...)`, keeping the statement size
+    independent of the number of rows. Values that cannot go through an
+    array, such as database defaults and expressions, fall back to a
+    `VALUES` list.
+    """
+    db_types = _unnest_db_types(all_fields, connection)
+
+    if db_types is not None:
+        cols = _get_value_cols(model_objs, all_fields, connection)  # type: ignore
+        if cols is not None:
+            placeholders = ", ".join(f"%s::{db_type}[]" for db_type in db_types)
+            return f"SELECT * FROM UNNEST({placeholders})", cols
+
+    rows = [
+        _get_values_for_row(queryset, model_obj, all_fields, connection)
+        for model_obj in model_objs
+    ]
+
+    if not any(val is _DB_DEFAULT for row in rows for val in row):
+        # Placeholders are identical across rows, so render the casted first
+        # row and the plain row template once instead of formatting per row.
+        first_row_sql = (
+            "(" + ", ".join(f"%s::{field.db_type(connection)}" for field in all_fields) + ")"
+        )
+        rest_row_sql = "(" + ", ".join(["%s"] * len(all_fields)) + ")"
+        row_values = [first_row_sql] + [rest_row_sql] * (len(rows) - 1)
+        sql_args = [val for row in rows for val in row]
+    else:
+        row_values = []
+        sql_args = []
+        for i, values_for_row in enumerate(rows):
+            sql_args.extend((val for val in values_for_row if val is not _DB_DEFAULT))
             row_values.append(
                 _format_placeholders_row(
-                    values_for_row,
-                    all_fields,
-                    connection,  # type: ignore
-                    include_cast=False,
+                    values_for_row, all_fields, connection, include_cast=i == 0
                 )
             )
 
-    return row_values, sql_args
+    return "VALUES " + ", ".join(row_values), sql_args
+
+
+@functools.lru_cache(maxsize=256)
+def _result_namedtuple(cols: Tuple[str, ...]) -> Any:
+    """Return a namedtuple class for a returning column set.
+
+    `collections.namedtuple` is far cheaper to construct than
+    `typing.NamedTuple` and the class is cached since returning shapes
+    repeat across calls.
+    """
+    return collections.namedtuple("Result", cols, rename=True)
+
+
+def _fetch_result_rows(cursor: "CursorWrapper") -> List["Row"]:
+    """Materialize returned rows as namedtuples.
+
+    Fetches in bounded chunks so peak memory is the final result list plus
+    one chunk of raw tuples, rather than a full second copy of the result
+    set from `fetchall`. The column set is read after the first fetch since
+    `cursor.description` isn't populated until results are forced in
+    pipeline mode.
+    """
+    nt_result = None
+    rows: List["Row"] = []
+
+    while chunk := cursor.fetchmany(1024):
+        if nt_result is None:
+            if not cursor.description:  # pragma: no cover - for type-safety
+                raise ValueError("Cursor must have a description to fetch result rows.")
+
+            nt_result = _result_namedtuple(tuple(col.name for col in cursor.description))
+
+        rows.extend(map(nt_result._make, chunk))
+
+    return rows
 
 
 def _get_returning_sql(
@@ -385,8 +570,13 @@ def _get_returning_sql(
     return "RETURNING " + returning_sql
 
 
+@functools.lru_cache(maxsize=None)
 def _model_fields(model: Type[models.Model]) -> List["models.Field[Any, Any]"]:
-    """Return the fields of a model, excluding generated and non-concrete ones."""
+    """Return the fields of a model, excluding generated and non-concrete ones.
+
+    Cached since model fields don't change at runtime and this is called
+    several times per operation.
+    """
     return [f for f in model._meta.fields if not getattr(f, "generated", False) and f.concrete]
 
 
@@ -396,68 +586,147 @@ def _get_update_fields_sql(
     alias: str,
     ignore_unchanged: bool,
     cursor: "CursorWrapper",
+    connection: "BaseDatabaseWrapper",
 ) -> Tuple[str, str]:
     """Render the SET and WHERE clause of update for every update field.
 
     If the WHERE clause is returned, it means we're ignoring unchanged rows.
     """
-    connection = connections[queryset.db]
     model = queryset.model
     cols = [model._meta.get_field(update_field).column for update_field in fields]
+    quoted_cols = [_quote(col, cursor) for col in cols]
     update_expressions = {
         f: f.expression for f in fields if isinstance(f, UpdateField) and f.expression
     }
-    update_fields_expressions = {col: f"{alias}.{_quote(col, cursor)}" for col in cols}
+    update_fields_expressions = {
+        col: f"{alias}.{quoted_col}" for col, quoted_col in zip(cols, quoted_cols, strict=True)
+    }
     if update_expressions:
-        connection = connections[queryset.db]
+        # mogrify is a client-side operation, so reuse the caller's cursor
+        # rather than opening another one.
         compiler = SQLCompiler(query=queryset.query, connection=connection, using=queryset.using)  # type: ignore
-        with connection.cursor() as cursor:
-            for field_name, expr in update_expressions.items():
-                expr = expr.resolve_expression(queryset.query, allow_joins=False, for_save=True)
-                val = cursor.mogrify(*expr.as_sql(compiler, connection))  #  type: ignore
-                val = cast(Union[str, bytes], val)
-                if isinstance(val, bytes):  # Psycopg 2/3 return different types
-                    val = val.decode("utf-8")
-                update_fields_expressions[model._meta.get_field(field_name).column] = val
+        for field_name, expr in update_expressions.items():
+            expr = expr.resolve_expression(queryset.query, allow_joins=False, for_save=True)
+            val = cursor.mogrify(*expr.as_sql(compiler, connection))  #  type: ignore
+            val = cast(Union[str, bytes], val)
+            if isinstance(val, bytes):  # Psycopg 2/3 return different types
+                val = val.decode("utf-8")
+            update_fields_expressions[model._meta.get_field(field_name).column] = val
 
     set_sql = ", ".join(
-        f"{_quote(col, cursor)} = {update_fields_expressions[col]}" for col in cols
+        f"{quoted_col} = {update_fields_expressions[col]}"
+        for col, quoted_col in zip(cols, quoted_cols, strict=True)
     )
     ignore_unchanged_sql = ""
     if ignore_unchanged and cols:
-        ignore_unchanged_sql = ("(({fields_sql}) IS DISTINCT FROM ({expressions_sql}))").format(
-            fields_sql=", ".join(
-                "{0}.{1}".format(_quote(model._meta.db_table, cursor), _quote(col, cursor))
-                for col in cols
-            ),
-            expressions_sql=", ".join(update_fields_expressions.values()),
-        )
+        quoted_table = _quote(model._meta.db_table, cursor)
+        fields_sql = ", ".join(f"{quoted_table}.{quoted_col}" for quoted_col in quoted_cols)
+        expressions_sql = ", ".join(update_fields_expressions.values())
+        ignore_unchanged_sql = f"(({fields_sql}) IS DISTINCT FROM ({expressions_sql}))"
 
     return set_sql, ignore_unchanged_sql
 
 
+@contextlib.contextmanager
+def _binary_results(cursor: "CursorWrapper") -> Any:
+    """Fetch result rows over the binary protocol on psycopg3.
+
+    Binary transfer of numeric, datetime, and array results is cheaper to
+    encode and parse than text. Parameters already use binary dumpers where
+    psycopg3 provides them, and the explicit casts keep types resolvable.
+    Client-side cursors, Django's default, don't support binary results, so
+    this only takes effect when server-side bindings are enabled.
+    """
+    inner_cursor = getattr(cursor, "cursor", None)
+    if (  # pragma: no cover - requires server-side bindings
+        psycopg_maj_version == 3
+        and inner_cursor is not None
+        and not isinstance(inner_cursor, psycopg.ClientCursor)  # type: ignore
+    ):
+        fmt = inner_cursor.format
+        inner_cursor.format = Format.BINARY  # type: ignore
+        try:
+            yield
+        finally:
+            inner_cursor.format = fmt
+    else:
+        yield
+
+
+@contextlib.contextmanager
+def _prepared_statements(cursor: "CursorWrapper") -> Any:
+    """Let psycopg3 promote repeated statements to server-side prepared plans.
+
+    The generated SQL is identical across calls since the UNNEST source table
+    keeps row counts out of the statement text, so repeated upserts and
+    updates of the same shape can reuse one server-side plan. Django disables
+    preparation by default because prepared statements break behind
+    transaction-mode poolers, so the threshold is only lowered when the
+    caller has preparation enabled on the connection.
+    """
+    if psycopg_maj_version == 3:
+        connection = cursor.connection
+        prepare_threshold = connection.prepare_threshold  # type: ignore
+        if prepare_threshold is not None:
+            connection.prepare_threshold = 1  # type: ignore
+        try:
+            yield
+        finally:
+            connection.prepare_threshold = prepare_threshold  # type: ignore
+    else:
+        yield
+
+
+def _execute_row_batch(
+    cursor: "CursorWrapper", sql: str, rows: List[List[Any]], using: str
+) -> None:
+    """Execute a per-row statement once for every row of arguments.
+
+    Uses `execute_batch` on psycopg2 and pipeline mode on psycopg3 so rows
+    are sent without a round trip per statement. The batch runs atomically
+    so that a failed row rolls back the whole batch, matching the behavior
+    of a single multi-row statement.
+    """
+    with transaction.atomic(using=using):
+        if psycopg_maj_version == 2:
+            execute_batch(cursor, sql, rows)  # type: ignore
+        else:
+            # Errors surfaced when the pipeline syncs happen outside Django's
+            # cursor wrapper, so wrap them into Django exceptions ourselves.
+            with connections[using].wrap_database_errors:  # type: ignore
+                with _prepared_statements(cursor), cursor.connection.pipeline():  # type: ignore
+                    cursor.executemany(sql, rows)
+
+
+def _upsert_fields(model: Type[models.Model], unique_fields: List[str]) -> List[AnyField]:
+    """Use all fields except auto fields unless in the uniqueness constraint."""
+    return [
+        field
+        for field in _model_fields(model)
+        if field.column in unique_fields or not isinstance(field, models.AutoField)
+    ]
+
+
 def _get_upsert_sql(
     queryset: models.QuerySet[_M],
-    model_objs: Iterable[_M],
+    model_objs: List[_M],
     unique_fields: List[str],
     update_fields: List[Union[str, UpdateField]],
     returning: Union[List[str], bool],
     ignore_unchanged: bool,
     cursor: "CursorWrapper",
-) -> Tuple[str, List[Any]]:
+    connection: "BaseDatabaseWrapper",
+    batch: bool = False,
+    plain_insert: bool = False,
+) -> Tuple[str, List[Any], bool]:
     """
     Generates the postgres specific sql necessary to perform an upsert
     (ON CONFLICT) INSERT INTO table_name (field1, field2)
-    VALUES (1, 'two')
+    SELECT * FROM UNNEST(%s::int[], %s::text[])
     ON CONFLICT (unique_field) DO UPDATE SET field2 = EXCLUDED.field2;
     """
     model = queryset.model
-    # Use all fields except auto fields unless in the uniqueness constraint
-    all_fields = [
-        field
-        for field in _model_fields(model)
-        if field.column in unique_fields or not isinstance(field, models.AutoField)
-    ]
+    all_fields = _upsert_fields(model, unique_fields)
 
     all_field_names = [field.column for field in all_fields]
     all_field_names_sql = ", ".join([_quote(field, cursor) for field in all_field_names])
@@ -466,7 +735,26 @@ def _get_upsert_sql(
     unique_db_cols = [model._meta.get_field(unique_field).column for unique_field in unique_fields]
     update_db_cols = [model._meta.get_field(update_field).column for update_field in update_fields]
 
-    row_values, sql_args = _get_values_for_rows(queryset, model_objs, all_fields)
+    sql_args: List[Any]
+    rows: List[List[Any]] = []
+
+    if batch:
+        rows = [
+            _get_values_for_row(queryset, model_obj, all_fields, connection)
+            for model_obj in model_objs
+        ]
+        batch = not any(
+            val is _DB_DEFAULT or hasattr(val, "as_sql") for row in rows for val in row
+        )
+
+    if batch:
+        values_sql = "VALUES " + _format_placeholders_row(
+            rows[0], all_fields, connection, include_cast=True
+        )
+        sql_args = rows
+    else:
+        values_sql, sql_args = _get_values_for_rows(queryset, model_objs, all_fields, connection)
+
     unique_field_names_sql = ", ".join([_quote(col, cursor) for col in unique_db_cols])
     update_fields_sql, ignore_unchanged_sql = _get_update_fields_sql(
         queryset=queryset,
@@ -474,6 +762,7 @@ def _get_upsert_sql(
         alias="EXCLUDED",
         ignore_unchanged=ignore_unchanged,
         cursor=cursor,
+        connection=connection,
     )
     if ignore_unchanged_sql:
         ignore_unchanged_sql = f"WHERE {ignore_unchanged_sql}"
@@ -481,26 +770,162 @@ def _get_upsert_sql(
     return_sql = _get_returning_sql(returning, model=model, cursor=cursor, include_status=True)
 
     on_conflict = (
-        "DO UPDATE SET {0} {1}".format(update_fields_sql, ignore_unchanged_sql)
+        f"DO UPDATE SET {update_fields_sql} {ignore_unchanged_sql}"
         if update_db_cols
         else "DO NOTHING"
     )
 
-    row_values_sql = ", ".join(row_values)
+    conflict_sql = "" if plain_insert else f" ON CONFLICT ({unique_field_names_sql}) {on_conflict}"
+
     sql = (
-        " INSERT INTO {table_name} ({all_field_names_sql})"
-        " VALUES {row_values_sql}"
-        " ON CONFLICT ({unique_field_names_sql}) {on_conflict} {return_sql}"
-    ).format(
-        table_name=model._meta.db_table,
-        all_field_names_sql=all_field_names_sql,
-        row_values_sql=row_values_sql,
-        unique_field_names_sql=unique_field_names_sql,
-        on_conflict=on_conflict,
-        return_sql=return_sql,
+        f" INSERT INTO {model._meta.db_table} ({all_field_names_sql})"
+        f" {values_sql}{conflict_sql} {return_sql}"
+    )
+
+    return sql, sql_args, batch
+
+
+def _in_pipeline(cursor: "CursorWrapper") -> bool:
+    """Check whether the connection is currently in pipeline mode."""
+    if psycopg_maj_version == 2:  # pragma: no cover
+        return False
+
+    return (
+        cursor.connection.info.pipeline_status  # type: ignore
+        != psycopg.pq.PipelineStatus.OFF  # type: ignore
     )
 
-    return sql, sql_args
+
+def _copy_upsert_eligible(
+    model_objs: List[_M],
+    all_fields: List[AnyField],
+    update_fields: List[Union[str, UpdateField]],
+) -> bool:
+    """
+    Check whether an upsert can go through the COPY path.
+
+    COPY streams literal row values, so expression update fields, expression
+    values, and database defaults all need the statement-based path.
+    """
+    if any(isinstance(field, UpdateField) and field.expression for field in update_fields):
+        return False
+
+    return not any(
+        hasattr(getattr(model_obj, field.attname), "resolve_expression")
+        for model_obj in model_objs
+        for field in all_fields
+    )
+
+
+def _upsert_via_copy(
+    queryset: models.QuerySet[_M],
+    model_objs: List[_M],
+    unique_fields: List[str],
+    update_fields: List[Union[str, UpdateField]],
+    returning: Union[List[str], bool],
+    ignore_unchanged: bool,
+    cursor: "CursorWrapper",
+    connection: "BaseDatabaseWrapper",
+) -> List["Row"]:
+    """
+    Upsert by COPYing rows into a temporary staging table and running a single
+    INSERT ... SELECT ... ON CONFLICT from it.
+
+    COPY avoids per-row statement encoding, so for large batches this is much
+    faster than a VALUES list while preserving conflict handling.
+    """
+    model = queryset.model
+    all_fields = _upsert_fields(model, unique_fields)
+    all_field_names_sql = ", ".join([_quote(field.column, cursor) for field in all_fields])
+
+    stage_table = "pgbulk_upsert_stage"
+    # Declare columns explicitly rather than with LIKE so the staging table
+    # doesn't inherit NOT NULL or other constraints from the target.
+    stage_cols_sql = ", ".join(
+        f"{_quote(field.column, cursor)} {field.db_type(connection=connection)}"  # type: ignore
+        for field in all_fields
+    )
+
+    cursor.execute(f"CREATE TEMP TABLE {stage_table} ({stage_cols_sql})")
+    try:
+        with cursor.copy(  # type: ignore
+            f"COPY {stage_table} ({all_field_names_sql}) FROM STDIN"
+        ) as copier:
+            for model_obj in model_objs:
+                row = _get_values_for_row(queryset, model_obj, all_fields, connection)
+                copier.write_row(row)
+
+        unique_db_cols = [
+            model._meta.get_field(unique_field).column for unique_field in unique_fields
+        ]
+        unique_field_names_sql = ", ".join([_quote(col, cursor) for col in unique_db_cols])
+        update_fields_sql, ignore_unchanged_sql = _get_update_fields_sql(
+            queryset=queryset,
+            fields=update_fields,
+            alias="EXCLUDED",
+            ignore_unchanged=ignore_unchanged,
+            cursor=cursor,
+            connection=connection,
+        )
+        if ignore_unchanged_sql:
+            ignore_unchanged_sql = f"WHERE {ignore_unchanged_sql}"
+
+        return_sql = _get_returning_sql(returning, model=model, cursor=cursor, include_status=True)
+
+        on_conflict = (
+            f"DO UPDATE SET {update_fields_sql} {ignore_unchanged_sql}"
+            if update_fields
+            else "DO NOTHING"
+        )
+
+        cursor.execute(
+            f" INSERT INTO {model._meta.db_table} ({all_field_names_sql})"
+            f" SELECT {all_field_names_sql} FROM {stage_table}"
+            f" ON CONFLICT ({unique_field_names_sql}) {on_conflict} {return_sql}"
+        )
+
+        return _fetch_result_rows(cursor) if returning else []
+    finally:
+        # In autocommit mode the staging table outlives an aborted statement,
+        # so always try to drop it. Suppress errors since the drop itself fails
+        # when the surrounding transaction has been aborted.
+        with contextlib.suppress(Exception):
+            cursor.execute(f"DROP TABLE IF EXISTS {stage_table}")
+
+
+def _batched(model_objs: List[_M], batch_size: int) -> Iterable[List[_M]]:
+    """Yield successive slices of at most ``batch_size`` rows."""
+    for start in range(0, len(model_objs), batch_size):
+        yield model_objs[start : start + batch_size]
+
+
+def _has_duplicate_keys(
+    queryset: models.QuerySet[_M], model_objs: List[_M], key_fields: List[str]
+) -> bool:
+    """Return True if two rows share the same values for the key fields."""
+    fields = [_fields_by_name(queryset.model)[key_field] for key_field in key_fields]
+    seen: "set[Tuple[Any, ...]]" = set()
+    for model_obj in model_objs:
+        key = tuple(getattr(model_obj, field.attname) for field in fields)
+        if key in seen:
+            return True
+
+        seen.add(key)
+
+    return False
+
+
+def _get_batch_size(batch_size: Union[int, None], num_fields: int) -> int:
+    """
+    Compute the number of rows per statement.
+
+    PostgreSQL caps bound parameters at 65535 per statement, and very large
+    VALUES lists degrade planning, so the default stays below both.
+    """
+    if batch_size is None:
+        batch_size = min(1000, 65535 // num_fields)
+
+    return max(batch_size, 1)
 
 
 def _upsert(
@@ -511,37 +936,133 @@ def _upsert(
     exclude: Union[List[str], None],
     returning: Union[List[str], bool],
     ignore_unchanged: bool,
+    conflicts_rare: bool,
+    batch_size: Union[int, None],
+    use_copy: Union[bool, Literal["auto"]],
     cursor: "CursorWrapper",
 ) -> Union[UpsertResult, None]:
     """Internal implementation of bulk upsert."""
+    if use_copy is True and psycopg_maj_version == 2:  # pragma: no cover
+        raise RuntimeError("Only psycopg3 is supported for use_copy.")
+
     exclude = exclude or []
+    connection = connections[queryset.db]
+
+    # Materialize up front so generators aren't exhausted by the first pass
+    model_objs = list(model_objs)
 
     # Populate automatically generated fields in the rows like date times
     _fill_auto_fields(queryset, model_objs)
 
-    # Sort the rows to reduce the chances of deadlock during concurrent upserts
-    model_objs = _sort_by_unique_fields(queryset, model_objs, unique_fields)
+    # Sort the rows to reduce the chances of deadlock during concurrent upserts.
+    # A single row can't deadlock against itself, so skip the sort entirely.
+    if len(model_objs) > 1 and unique_fields:
+        model_objs = _sort_by_unique_fields(queryset, model_objs, unique_fields, connection)
     update_fields = _filter_fields(queryset, update_fields, exclude=[*exclude, *unique_fields])  # type: ignore
 
     upserted: List["Row"] = []
 
     if model_objs:
-        sql, sql_args = _get_upsert_sql(
-            queryset,
-            model_objs,
-            unique_fields=unique_fields,
-            update_fields=update_fields,
-            returning=returning,
-            ignore_unchanged=ignore_unchanged,
-            cursor=cursor,
+        if use_copy == "auto":
+            use_copy = psycopg_maj_version == 3 and len(model_objs) >= _COPY_UPSERT_THRESHOLD
+
+        # COPY itself is unsupported in pipeline mode, so fall back to the
+        # statement-based path inside pipeline()
+        if (
+            use_copy
+            and not _in_pipeline(cursor)
+            and _copy_upsert_eligible(
+                model_objs, _upsert_fields(queryset.model, unique_fields), update_fields
+            )
+        ):
+            upserted = _upsert_via_copy(
+                queryset,
+                model_objs,
+                unique_fields=unique_fields,
+                update_fields=update_fields,
+                returning=returning,
+                ignore_unchanged=ignore_unchanged,
+                cursor=cursor,
+                connection=connection,
+            )
+            return UpsertResult(upserted) if returning else None
+
+        batch_size = _get_batch_size(batch_size, len(_model_fields(queryset.model)) or 1)
+
+        # A plain INSERT avoids the server-side cost of speculative insertion
+        # when the caller expects no conflicts and requests no updates.
+        plain_insert = conflicts_rare and not update_fields
+
+        # Small batches without RETURNING or update expressions can be
+        # executed as a batch of identical per-row statements instead of one
+        # large statement. Rows with duplicate unique keys take the
+        # single-statement path so conflicts within a batch surface the same
+        # way regardless of whether results are returned.
+        row_batch = (
+            not plain_insert
+            and not returning
+            and len(model_objs) <= _ROW_BATCH_THRESHOLD
+            and not any(
+                isinstance(field, UpdateField) and field.expression for field in update_fields
+            )
+            and not _has_duplicate_keys(queryset, model_objs, unique_fields)
         )
 
-        sql_args = _prep_sql_args(queryset, cursor=cursor, sql_args=sql_args)
-        cursor.execute(sql, sql_args)
-        if cursor.description:
-            result = [(col.name, Any) for col in cursor.description]
-            nt_result = NamedTuple("Result", result)
-            upserted = cast(List["Row"], [nt_result(*row) for row in cursor.fetchall()])
+        # Run every chunk in one transaction so a failure in any chunk rolls
+        # back the whole call, preserving single-statement atomicity.
+        with transaction.atomic(using=queryset.db):
+            for chunk in _batched(model_objs, batch_size):
+                sql, sql_args, batch = _get_upsert_sql(
+                    queryset,
+                    chunk,
+                    unique_fields=unique_fields,
+                    update_fields=update_fields,
+                    returning=returning,
+                    ignore_unchanged=ignore_unchanged,
+                    cursor=cursor,
+                    connection=connection,
+                    batch=row_batch,
+                    plain_insert=plain_insert,
+                )
+
+                if batch:
+                    _execute_row_batch(cursor, sql, sql_args, using=queryset.db)
+                elif plain_insert:
+                    sql_args = _prep_sql_args(queryset, cursor=cursor, sql_args=sql_args)
+                    # atomic() opens a transaction under autocommit and a savepoint
+                    # inside an existing transaction, so a unique violation can be
+                    # rolled back before retrying with the conflict-handling
+                    # statement.
+                    try:
+                        with transaction.atomic(using=queryset.db):
+                            with _prepared_statements(cursor), _binary_results(cursor):
+                                cursor.execute(sql, sql_args)
+                    except IntegrityError as exc:
+                        if not isinstance(exc.__cause__, UniqueViolation):
+                            raise
+
+                        sql, sql_args, _ = _get_upsert_sql(
+                            queryset,
+                            chunk,
+                            unique_fields=unique_fields,
+                            update_fields=update_fields,
+                            returning=returning,
+                            ignore_unchanged=ignore_unchanged,
+                            cursor=cursor,
+                            connection=connection,
+                        )
+                        sql_args = _prep_sql_args(queryset, cursor=cursor, sql_args=sql_args)
+                        with _prepared_statements(cursor), _binary_results(cursor):
+                            cursor.execute(sql, sql_args)
+                else:
+                    sql_args = _prep_sql_args(queryset, cursor=cursor, sql_args=sql_args)
+                    with _prepared_statements(cursor), _binary_results(cursor):
+                        cursor.execute(sql, sql_args)
+
+                # Fetch by the returning flag rather than cursor.description, which
+                # isn't populated until results are forced in pipeline mode
+                if returning:
+                    upserted.extend(_fetch_result_rows(cursor))
 
     return UpsertResult(upserted) if returning else None
 
@@ -553,6 +1074,7 @@ def _update(
     exclude: Union[List[str], None],
     returning: Union[List[str], bool],
     ignore_unchanged: bool,
+    batch_size: Union[int, None],
     cursor: "CursorWrapper",
 ) -> Union[List["Row"], None]:
     """
@@ -562,7 +1084,6 @@ def _update(
     connection = connections[queryset.db]
     alias = "new_values"
     update_fields = _filter_fields(queryset, update_fields, exclude)  # type: ignore
-    update_db_cols = [model._meta.get_field(update_field).column for update_field in update_fields]
 
     # Sort the model objects to reduce the likelihood of deadlocks
     model_objs = sorted(model_objs, key=lambda obj: obj.pk)
@@ -573,86 +1094,92 @@ def _update(
     # Add the pk to the value fields so we can join during the update.
     value_fields = [model._meta.pk.attname] + update_fields
 
-    row_values = [
-        [
-            _get_field_db_val(
-                queryset,
-                model_obj._meta.get_field(field),
-                getattr(model_obj, model_obj._meta.get_field(field).attname),
-                connection,  # type: ignore
-            )
-            for field in value_fields
-        ]
-        for model_obj in model_objs
-    ]
-
     # If we do not have any values or fields to update, just return
-    if len(row_values) == 0 or len(update_fields) == 0:
+    if len(model_objs) == 0 or len(update_fields) == 0:
         return [] if returning else None
 
-    db_types = [model._meta.get_field(field).db_type(connection) for field in value_fields]
+    value_field_objs = [model._meta.get_field(field) for field in value_fields]
+    batch_size = _get_batch_size(batch_size, len(value_field_objs))
 
-    value_fields_sql = ", ".join(
-        "{field}".format(field=_quote(model._meta.get_field(field).column, cursor))
-        for field in value_fields
-    )
+    value_fields_sql = ", ".join(_quote(field.column, cursor) for field in value_field_objs)
 
-    update_fields_sql = ", ".join(
-        "{field} = {alias}.{field}".format(field=_quote(col, cursor), alias=alias)
-        for col in update_db_cols
-    )
     update_fields_sql, ignore_unchanged_sql = _get_update_fields_sql(
         queryset=queryset,
         fields=update_fields,
         alias=alias,
         ignore_unchanged=ignore_unchanged,
         cursor=cursor,
-    )
-
-    values_sql = ", ".join(
-        [
-            "({0})".format(
-                ", ".join(
-                    [
-                        "%s::{0}".format(db_types[i]) if not row_number and i else "%s"
-                        for i, _ in enumerate(row)
-                    ]
-                )
-            )
-            for row_number, row in enumerate(row_values)
-        ]
+        connection=connection,
     )
 
     if ignore_unchanged_sql:
         ignore_unchanged_sql = f"AND {ignore_unchanged_sql}"
 
-    update_sql = (
-        "UPDATE {table} "
-        "SET {update_fields_sql} "
-        "FROM (VALUES {values_sql}) AS {alias} ({value_fields_sql}) "
-        "WHERE {table}.{pk_field} = new_values.{pk_field} {ignore_unchanged_sql} "
-        "{returning_sql}"
-    ).format(
-        table=_quote(model._meta.db_table, cursor),
-        pk_field=_quote(model._meta.pk.column, cursor),
-        alias=alias,
-        update_fields_sql=update_fields_sql,
-        values_sql=values_sql,
-        value_fields_sql=value_fields_sql,
-        ignore_unchanged_sql=ignore_unchanged_sql,
-        returning_sql=_get_returning_sql(
-            returning=returning, model=model, include_status=False, cursor=cursor
-        ),
+    table_sql = _quote(model._meta.db_table, cursor)
+    pk_field_sql = _quote(model._meta.pk.column, cursor)
+    returning_sql = _get_returning_sql(
+        returning=returning, model=model, include_status=False, cursor=cursor
     )
 
-    update_sql_params = list(itertools.chain(*row_values))
-    update_sql_params = _prep_sql_args(queryset, cursor=cursor, sql_args=update_sql_params)
-    cursor.execute(update_sql, update_sql_params)
     updated: List["Row"] = []
-    if cursor.description:
-        result = [(col.name, Any) for col in cursor.description]
-        nt_result = NamedTuple("Result", result)
-        updated = cast(List["Row"], [nt_result(*row) for row in cursor.fetchall()])
+
+    # Small batches without RETURNING can be executed as a batch of identical
+    # per-row statements instead of one large statement. Rows with duplicate
+    # primary keys take the single-statement path for consistent semantics.
+    row_batch = (
+        not returning
+        and len(model_objs) <= _ROW_BATCH_THRESHOLD
+        and not _has_duplicate_keys(queryset, model_objs, [model._meta.pk.attname])
+    )
+
+    # Run every chunk in one transaction so a failure in any chunk rolls
+    # back the whole call, preserving single-statement atomicity.
+    with transaction.atomic(using=queryset.db):
+        for chunk in _batched(model_objs, batch_size):
+            update_sql_params: List[Any]
+            rows: List[List[Any]] = []
+            batch = row_batch
+
+            if batch:
+                rows = [
+                    _get_values_for_row(queryset, model_obj, value_field_objs, connection)
+                    for model_obj in chunk
+                ]
+                batch = not any(
+                    val is _DB_DEFAULT or hasattr(val, "as_sql") for row in rows for val in row
+                )
+
+            if batch:
+                values_sql = "VALUES " + _format_placeholders_row(
+                    rows[0], value_field_objs, connection, include_cast=True
+                )
+                update_sql_params = rows
+            else:
+                values_sql, update_sql_params = _get_values_for_rows(
+                    queryset, chunk, value_field_objs, connection
+                )
+
+            update_sql = (
+                f"UPDATE {table_sql} "
+                f"SET {update_fields_sql} "
+                f"FROM ({values_sql}) AS {alias} ({value_fields_sql}) "
+                f"WHERE {table_sql}.{pk_field_sql} = {alias}.{pk_field_sql} "
+                f"{ignore_unchanged_sql} {returning_sql}"
+            )
+
+            if batch:
+                _execute_row_batch(cursor, update_sql, update_sql_params, using=queryset.db)
+            else:
+                update_sql_params = _prep_sql_args(
+                    queryset, cursor=cursor, sql_args=update_sql_params
+                )
+                with _prepared_statements(cursor), _binary_results(cursor):
+                    cursor.execute(update_sql, update_sql_params)
+
+            # Fetch by the returning flag rather than cursor.description, which
+            # isn't populated until results are forced in pipeline mode
+            if returning:
+                updated.extend(_fetch_result_rows(cursor))
 
     return updated if returning else None
 
@@ -666,6 +1193,7 @@ def update(
     exclude: Union[List[str], None] = None,
     returning: Union[List[str], Literal[True]],
     ignore_unchanged: bool = False,
+    batch_size: Union[int, None] = None,
 ) -> List["Row"]: ...
 
 
@@ -678,6 +1206,7 @@ def update(
     exclude: Union[List[str], None] = None,
     returning: Literal[False] = False,
     ignore_unchanged: bool = False,
+    batch_size: Union[int, None] = None,
 ) -> None: ...
 
 
@@ -690,6 +1219,7 @@ def update(
     exclude: Union[List[str], None] = None,
     returning: Union[List[str], bool] = False,
     ignore_unchanged: bool = False,
+    batch_size: Union[int, None] = None,
 ) -> Union[List["Row"], None]: ...
 
 
@@ -701,6 +1231,7 @@ def update(
     exclude: Union[List[str], None] = None,
     returning: Union[List[str], bool] = False,
     ignore_unchanged: bool = False,
+    batch_size: Union[int, None] = None,
 ) -> Union[List["Row"], None]:
     """
     Performs a bulk update.
@@ -716,6 +1247,11 @@ def update(
         returning: If True, returns all fields. If a list, only returns fields
             in the list. If False, do not return results from the upsert.
         ignore_unchanged: Ignore unchanged rows in updates.
+        batch_size: The number of rows to update per statement. Defaults to
+            staying under PostgreSQL's limit of 65535 bound parameters per
+            statement. All batches of a call run in one transaction. Small
+            calls with no results returned and no expression values are sent
+            as a batch of per-row statements.
 
     Note:
         Model signals such as `post_save` are not emitted.
@@ -732,6 +1268,7 @@ def update(
             exclude=exclude,
             returning=returning,
             ignore_unchanged=ignore_unchanged,
+            batch_size=batch_size,
             cursor=cursor,
         )
 
@@ -745,6 +1282,7 @@ async def aupdate(
     exclude: Union[List[str], None] = None,
     returning: Union[List[str], Literal[True]],
     ignore_unchanged: bool = False,
+    batch_size: Union[int, None] = None,
 ) -> List["Row"]: ...
 
 
@@ -757,6 +1295,7 @@ async def aupdate(
     exclude: Union[List[str], None] = None,
     returning: Literal[False] = False,
     ignore_unchanged: bool = False,
+    batch_size: Union[int, None] = None,
 ) -> None: ...
 
 
@@ -769,6 +1308,7 @@ async def aupdate(
     exclude: Union[List[str], None] = None,
     returning: Union[List[str], bool] = False,
     ignore_unchanged: bool = False,
+    batch_size: Union[int, None] = None,
 ) -> Union[List["Row"], None]: ...
 
 
@@ -780,6 +1320,7 @@ async def aupdate(
     exclude: Union[List[str], None] = None,
     returning: Union[List[str], bool] = False,
     ignore_unchanged: bool = False,
+    batch_size: Union[int, None] = None,
 ) -> Union[List["Row"], None]:
     """
     Perform an asynchronous bulk update.
@@ -798,6 +1339,7 @@ async def aupdate(
         exclude=exclude,
         returning=returning,
         ignore_unchanged=ignore_unchanged,
+        batch_size=batch_size,
     )
 
 
@@ -811,6 +1353,9 @@ def upsert(
     exclude: Union[List[str], None] = None,
     returning: Union[List[str], Literal[True]],
     ignore_unchanged: bool = False,
+    conflicts_rare: bool = False,
+    batch_size: Union[int, None] = None,
+    use_copy: Union[bool, Literal["auto"]] = "auto",
 ) -> UpsertResult: ...
 
 
@@ -824,6 +1369,9 @@ def upsert(
     exclude: Union[List[str], None] = None,
     returning: Literal[False] = False,
     ignore_unchanged: bool = False,
+    conflicts_rare: bool = False,
+    batch_size: Union[int, None] = None,
+    use_copy: Union[bool, Literal["auto"]] = "auto",
 ) -> None: ...
 
 
@@ -837,6 +1385,9 @@ def upsert(
     exclude: Union[List[str], None] = None,
     returning: Union[List[str], bool] = False,
     ignore_unchanged: bool = False,
+    conflicts_rare: bool = False,
+    batch_size: Union[int, None] = None,
+    use_copy: Union[bool, Literal["auto"]] = "auto",
 ) -> Union[UpsertResult, None]: ...
 
 
@@ -849,6 +1400,9 @@ def upsert(
     exclude: Union[List[str], None] = None,
     returning: Union[List[str], bool] = False,
     ignore_unchanged: bool = False,
+    conflicts_rare: bool = False,
+    batch_size: Union[int, None] = None,
+    use_copy: Union[bool, Literal["auto"]] = "auto",
 ) -> Union[UpsertResult, None]:
     """
     Perform a bulk upsert.
@@ -871,6 +1425,21 @@ def upsert(
         returning: If True, returns all fields. If a list, only returns fields
             in the list. If False, do not return results from the upsert.
         ignore_unchanged: Ignore unchanged rows in updates.
+        conflicts_rare: If `update_fields` is an empty list and conflicts are
+            not expected, first try a plain `INSERT` without an `ON CONFLICT`
+            clause and only fall back to the conflict-handling statement when
+            a unique violation occurs. A plain `INSERT` avoids the server-side
+            cost of speculative insertion.
+        batch_size: The number of rows to upsert per statement. Defaults to
+            staying under PostgreSQL's limit of 65535 bound parameters per
+            statement. All batches of a call run in one transaction. Small
+            calls with no results returned and no update expressions are sent
+            as a batch of per-row statements.
+        use_copy: If True, `COPY` rows into a temporary staging table and
+            upsert from it with a single statement, which is faster for
+            large batches. Defaults to "auto", which uses `COPY` for batches
+            of at least 5000 rows. Requires psycopg3. Rows with expressions
+            or database defaults always use the statement-based path.
 
     Returns:
         If `returning=True`, the upserted result, an iterable list of all upsert objects.
@@ -890,6 +1459,9 @@ def upsert(
             returning=returning,
             exclude=exclude,
             ignore_unchanged=ignore_unchanged,
+            conflicts_rare=conflicts_rare,
+            batch_size=batch_size,
+            use_copy=use_copy,
             cursor=cursor,
         )
 
@@ -904,6 +1476,9 @@ async def aupsert(
     exclude: Union[List[str], None] = None,
     returning: Union[List[str], Literal[True]],
     ignore_unchanged: bool = False,
+    conflicts_rare: bool = False,
+    batch_size: Union[int, None] = None,
+    use_copy: Union[bool, Literal["auto"]] = "auto",
 ) -> UpsertResult: ...
 
 
@@ -917,6 +1492,9 @@ async def aupsert(
     exclude: Union[List[str], None] = None,
     returning: Literal[False] = False,
     ignore_unchanged: bool = False,
+    conflicts_rare: bool = False,
+    batch_size: Union[int, None] = None,
+    use_copy: Union[bool, Literal["auto"]] = "auto",
 ) -> None: ...
 
 
@@ -930,6 +1508,9 @@ async def aupsert(
     exclude: Union[List[str], None] = None,
     returning: Union[List[str], bool] = False,
     ignore_unchanged: bool = False,
+    conflicts_rare: bool = False,
+    batch_size: Union[int, None] = None,
+    use_copy: Union[bool, Literal["auto"]] = "auto",
 ) -> Union[UpsertResult, None]: ...
 
 
@@ -942,6 +1523,9 @@ async def aupsert(
     exclude: Union[List[str], None] = None,
     returning: Union[List[str], bool] = False,
     ignore_unchanged: bool = False,
+    conflicts_rare: bool = False,
+    batch_size: Union[int, None] = None,
+    use_copy: Union[bool, Literal["auto"]] = "auto",
 ) -> Union[UpsertResult, None]:
     """
     Perform an asynchronous bulk upsert.
@@ -961,12 +1545,15 @@ async def aupsert(
         returning=returning,
         exclude=exclude,
         ignore_unchanged=ignore_unchanged,
+        conflicts_rare=conflicts_rare,
+        batch_size=batch_size,
+        use_copy=use_copy,
     )
 
 
 def _postgres_types_for_fields(
     fields: List["models.Field[Any, Any]"],
-    connection: "DefaultConnectionProxy",
+    connection: "BaseDatabaseWrapper",
 ) -> List[str]:
     def _simplify_type(field_type: str) -> str:
         # Remove any size/precision/scale information, as Psycopg doesn't accept it.
@@ -1006,6 +1593,9 @@ def copy(
     queryset = queryset if isinstance(queryset, models.QuerySet) else queryset.objects.all()
     model = queryset.model
 
+    # Materialize up front so generators aren't exhausted by the first pass
+    model_objs = list(model_objs)
+
     # Populate automatically-generated fields in the rows like date times
     _fill_auto_fields(queryset, model_objs)
 
@@ -1033,7 +1623,7 @@ def copy(
                 copier.set_types(postgres_types)  # type: ignore
 
             for model_obj in model_objs:
-                row = _get_values_for_row(queryset, model_obj, fields, copying=True)
+                row = _get_values_for_row(queryset, model_obj, fields, connection, copying=True)
                 copier.write_row(row)  # type: ignore
 
 
@@ -1062,3 +1652,36 @@ async def acopy(
         exclude=exclude,
         binary=binary,
     )
+
+
+@contextlib.contextmanager
+def pipeline(using: Union[str, None] = None) -> Any:
+    """
+    Pipeline statements issued inside the block.
+
+    On psycopg3, statements from calls such as [pgbulk.upsert][] and
+    [pgbulk.update][] made inside the context are sent to the server without
+    waiting for each reply, amortizing the network round trip when chaining
+    several calls against a remote database. Calls that fetch results, such
+    as upserts with `returning`, synchronize the pipeline when the results
+    are read. On psycopg2 this is a no-op.
+
+    Args:
+        using: The database over which statements are pipelined.
+            Defaults to the default database.
+
+    Example:
+        Chain multiple upserts:
+
+            with pgbulk.pipeline():
+                pgbulk.upsert(MyModel, ...)
+                pgbulk.upsert(OtherModel, ...)
+    """
+    connection = connections[using or DEFAULT_DB_ALIAS]
+
+    if psycopg_maj_version == 3:
+        connection.ensure_connection()
+        with connection.connection.pipeline():  # type: ignore
+            yield
+    else:  # pragma: no cover
+        yield
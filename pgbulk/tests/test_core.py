@@ -5,8 +5,8 @@ import freezegun
 import pytest
 from asgiref.sync import async_to_sync
 from django import __version__ as DJANGO_VERSION
-from django.db import transaction
-from django.db.models import F
+from django.db import IntegrityError, ProgrammingError, connection, transaction
+from django.db.models import F, Value
 from pytz import timezone
 
 import pgbulk
@@ -109,6 +109,24 @@ def test_func_field_upsert():
     assert models.TestFuncFieldModel.objects.get(my_key="b").other_int_val == -5
 
 
+@pytest.mark.skipif(psycopg_maj_version == 2, reason="Only run on psycopg3")
+@pytest.mark.django_db
+def test_upsert_expression_values():
+    """
+    Tests upserting rows whose values are expressions, which are rendered as
+    literals in the statement.
+    """
+    results = pgbulk.upsert(
+        models.TestFuncFieldModel,
+        [models.TestFuncFieldModel(my_key="a", int_val=Value(3))],
+        ["my_key"],
+        ["int_val"],
+        returning=True,
+    )
+    assert len(results.created) == 1
+    assert models.TestFuncFieldModel.objects.get().int_val == 3
+
+
 @pytest.mark.django_db
 def test_auto_field_upsert():
     """Verifies that upsert works with custom AutoFields"""
@@ -309,6 +327,359 @@ def test_upsert_wo_update_fields():
         assert test_model.float_field == expected_int_value
 
 
+@pytest.mark.django_db
+def test_upsert_conflicts_rare():
+    """
+    Tests bulk_upsert with conflicts_rare, which tries a plain INSERT first
+    and falls back to conflict handling when a unique violation happens.
+    """
+    # No pre-existing rows, so the plain INSERT path succeeds
+    results = pgbulk.upsert(
+        models.TestModel,
+        [
+            models.TestModel(int_field=1, float_field=1),
+            models.TestModel(int_field=2, float_field=2),
+        ],
+        ["int_field"],
+        update_fields=[],
+        returning=True,
+        conflicts_rare=True,
+    )
+    assert len(results.created) == 2
+    assert models.TestModel.objects.count() == 2
+
+    # A conflicting row triggers the fallback to the ON CONFLICT statement
+    pgbulk.upsert(
+        models.TestModel,
+        [
+            models.TestModel(int_field=2, float_field=3),
+            models.TestModel(int_field=3, float_field=3),
+        ],
+        ["int_field"],
+        update_fields=[],
+        conflicts_rare=True,
+    )
+    assert models.TestModel.objects.count() == 3
+    for test_model, expected_float_value in zip(
+        models.TestModel.objects.order_by("int_field"), [1, 2, 3], strict=True
+    ):
+        assert test_model.float_field == expected_float_value
+
+
+@pytest.mark.django_db
+def test_upsert_conflicts_rare_returning_fallback():
+    """
+    Tests that the conflict-handling fallback preserves RETURNING results.
+    """
+    ddf.G(models.TestModel, int_field=1, float_field=1)
+    results = pgbulk.upsert(
+        models.TestModel,
+        [
+            models.TestModel(int_field=1, float_field=2),
+            models.TestModel(int_field=2, float_field=2),
+        ],
+        ["int_field"],
+        update_fields=[],
+        returning=True,
+        conflicts_rare=True,
+    )
+    assert len(results.created) == 1
+    assert results.created[0].int_field == 2
+    assert models.TestModel.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_upsert_conflicts_rare_other_integrity_error():
+    """
+    Tests that conflicts_rare re-raises integrity errors that aren't unique
+    violations instead of retrying.
+    """
+    with pytest.raises(IntegrityError):
+        pgbulk.upsert(
+            models.TestFuncFieldModel,
+            [models.TestFuncFieldModel(my_key="a", int_val=None)],
+            ["my_key"],
+            update_fields=[],
+            conflicts_rare=True,
+        )
+
+
+@pytest.mark.django_db(transaction=True)
+def test_upsert_conflicts_rare_autocommit():
+    """
+    Tests conflicts_rare in autocommit mode, where the plain INSERT attempt
+    must open its own transaction instead of relying on an existing one.
+    """
+    results = pgbulk.upsert(
+        models.TestModel,
+        [models.TestModel(int_field=1, float_field=1)],
+        ["int_field"],
+        update_fields=[],
+        returning=True,
+        conflicts_rare=True,
+    )
+    assert len(results.created) == 1
+
+    # A conflicting row triggers the fallback outside of a transaction too
+    pgbulk.upsert(
+        models.TestModel,
+        [models.TestModel(int_field=1, float_field=2)],
+        ["int_field"],
+        update_fields=[],
+        conflicts_rare=True,
+    )
+    assert models.TestModel.objects.count() == 1
+    assert models.TestModel.objects.get().float_field == 1
+
+
+@pytest.mark.django_db
+def test_upsert_batch_size():
+    """
+    Tests that upserts spanning multiple batches return results for every row.
+    """
+    results = pgbulk.upsert(
+        models.TestModel,
+        [models.TestModel(int_field=i, float_field=i) for i in range(5)],
+        ["int_field"],
+        returning=True,
+        batch_size=2,
+    )
+    assert len(results.created) == 5
+    assert models.TestModel.objects.count() == 5
+
+    results = pgbulk.upsert(
+        models.TestModel,
+        [models.TestModel(int_field=i, float_field=i + 1) for i in range(5)],
+        ["int_field"],
+        returning=True,
+        batch_size=2,
+    )
+    assert len(results.updated) == 5
+    for test_model in models.TestModel.objects.all():
+        assert test_model.float_field == test_model.int_field + 1
+
+
+@pytest.mark.django_db
+def test_upsert_duplicate_keys_consistent():
+    """
+    Tests that duplicate unique keys raise a cardinality violation whether or
+    not results are returned.
+    """
+
+    def objs():
+        return [
+            models.TestModel(int_field=1, float_field=1),
+            models.TestModel(int_field=1, float_field=2),
+        ]
+
+    with pytest.raises(ProgrammingError):
+        pgbulk.upsert(models.TestModel, objs(), ["int_field"], ["float_field"])
+
+    with pytest.raises(ProgrammingError):
+        pgbulk.upsert(models.TestModel, objs(), ["int_field"], ["float_field"], returning=True)
+
+
+@pytest.mark.django_db
+def test_upsert_over_row_batch_threshold():
+    """
+    Tests that calls above the per-row batch threshold use a single statement
+    per chunk.
+    """
+    pgbulk.upsert(
+        models.TestModel,
+        [models.TestModel(int_field=i, float_field=i) for i in range(150)],
+        ["int_field"],
+        ["float_field"],
+    )
+    assert models.TestModel.objects.count() == 150
+
+
+@pytest.mark.django_db
+def test_update_duplicate_pks():
+    """
+    Tests that rows with duplicate primary keys update through the
+    single-statement path.
+    """
+    obj = models.TestModel.objects.create(int_field=1, float_field=1)
+    pgbulk.update(
+        models.TestModel,
+        [
+            models.TestModel(id=obj.id, float_field=2),
+            models.TestModel(id=obj.id, float_field=2),
+        ],
+        ["float_field"],
+    )
+    obj.refresh_from_db()
+    assert obj.float_field == 2
+
+
+@pytest.mark.django_db
+def test_update_over_row_batch_threshold():
+    """
+    Tests that update calls above the per-row batch threshold use a single
+    statement per chunk.
+    """
+    objs = models.TestModel.objects.bulk_create(
+        models.TestModel(int_field=i, float_field=0) for i in range(101)
+    )
+    for obj in objs:
+        obj.float_field = obj.int_field + 1
+
+    pgbulk.update(models.TestModel, objs, ["float_field"])
+    assert not models.TestModel.objects.filter(float_field=0).exists()
+
+
+@pytest.mark.django_db
+def test_upsert_batch_rollback_on_error():
+    """
+    Tests that a failing row rolls back the whole per-row batch.
+    """
+    with pytest.raises(IntegrityError):
+        pgbulk.upsert(
+            models.TestFuncFieldModel,
+            [
+                models.TestFuncFieldModel(my_key="a", int_val=1),
+                models.TestFuncFieldModel(my_key="b", int_val=None),
+            ],
+            ["my_key"],
+            ["int_val"],
+        )
+
+    assert not models.TestFuncFieldModel.objects.exists()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_upsert_chunked_atomicity():
+    """
+    Tests that a failure in a later chunk rolls back earlier chunks, even in
+    autocommit mode.
+    """
+    with pytest.raises(IntegrityError):
+        pgbulk.upsert(
+            models.TestFuncFieldModel,
+            [
+                models.TestFuncFieldModel(my_key="a", int_val=1),
+                models.TestFuncFieldModel(my_key="b", int_val=None),
+            ],
+            ["my_key"],
+            ["int_val"],
+            batch_size=1,
+        )
+
+    assert not models.TestFuncFieldModel.objects.exists()
+
+
+@pytest.mark.django_db
+def test_upsert_returning_multiple_fetch_chunks():
+    """
+    Tests that returned rows spanning more than one fetch chunk are all
+    materialized.
+    """
+    results = pgbulk.upsert(
+        models.TestModel,
+        [models.TestModel(int_field=i) for i in range(1500)],
+        ["int_field"],
+        returning=True,
+        batch_size=1500,
+    )
+    assert len(results.created) == 1500
+    assert models.TestModel.objects.count() == 1500
+
+
+@pytest.mark.skipif(psycopg_maj_version == 2, reason="Only run on psycopg3")
+@pytest.mark.django_db
+def test_upsert_use_copy():
+    """
+    Tests upserting through the COPY-based staging table path.
+    """
+    results = pgbulk.upsert(
+        models.TestModel,
+        [models.TestModel(int_field=i, float_field=i) for i in range(5)],
+        ["int_field"],
+        returning=True,
+        use_copy=True,
+    )
+    assert len(results.created) == 5
+    assert models.TestModel.objects.count() == 5
+
+    results = pgbulk.upsert(
+        models.TestModel,
+        [models.TestModel(int_field=i, float_field=i + 1) for i in range(10)],
+        ["int_field"],
+        returning=True,
+        use_copy=True,
+    )
+    assert len(results.created) == 5
+    assert len(results.updated) == 5
+    assert models.TestModel.objects.count() == 10
+    for test_model in models.TestModel.objects.all():
+        assert test_model.float_field == test_model.int_field + 1
+
+
+@pytest.mark.skipif(psycopg_maj_version == 2, reason="Only run on psycopg3")
+@pytest.mark.django_db
+def test_upsert_use_copy_expression_fallback():
+    """
+    Tests that use_copy falls back to the statement-based path when update
+    fields use expressions.
+    """
+    models.TestFuncFieldModel.objects.create(my_key="a", int_val=1)
+    pgbulk.upsert(
+        models.TestFuncFieldModel,
+        [models.TestFuncFieldModel(my_key="a", int_val=0)],
+        ["my_key"],
+        [pgbulk.UpdateField("int_val", expression=F("int_val") + 1)],
+        use_copy=True,
+    )
+    assert models.TestFuncFieldModel.objects.get().int_val == 2
+
+
+@pytest.mark.skipif(psycopg_maj_version == 2, reason="Only run on psycopg3")
+@pytest.mark.django_db
+def test_upsert_use_copy_ignore_unchanged():
+    """
+    Tests that the COPY path only returns changed rows with ignore_unchanged.
+    """
+    ddf.G(models.TestModel, int_field=1, float_field=1)
+    ddf.G(models.TestModel, int_field=2, float_field=1)
+    results = pgbulk.upsert(
+        models.TestModel,
+        [
+            models.TestModel(int_field=1, float_field=1),
+            models.TestModel(int_field=2, float_field=2),
+        ],
+        ["int_field"],
+        ["float_field"],
+        returning=True,
+        ignore_unchanged=True,
+        use_copy=True,
+    )
+    assert len(results) == 1
+    assert len(results.updated) == 1
+    assert results.updated[0].int_field == 2
+
+
+@pytest.mark.django_db
+def test_update_batch_size():
+    """
+    Tests that updates spanning multiple batches update and return every row.
+    """
+    test_models = [ddf.G(models.TestModel, int_field=i, float_field=0) for i in range(5)]
+    for test_model in test_models:
+        test_model.float_field = test_model.int_field + 1
+
+    updated = pgbulk.update(
+        models.TestModel,
+        test_models,
+        ["float_field"],
+        returning=True,
+        batch_size=2,
+    )
+    assert len(updated) == 5
+    for test_model in models.TestModel.objects.all():
+        assert test_model.float_field == test_model.int_field + 1
+
+
 @pytest.mark.django_db
 def test_upsert_w_blank_arguments():
     """
@@ -1445,3 +1816,56 @@ def test_copy_with_db_defaults():
         ["int_field"],
     )
     assert models.TestDbDefaultModelWithOrmDefault.objects.get().int_field == 1
+
+
+@pytest.mark.django_db
+def test_pipeline():
+    """
+    Tests chaining upserts and updates inside the pipeline context manager.
+    """
+    with pgbulk.pipeline():
+        pgbulk.upsert(
+            models.TestModel,
+            [models.TestModel(int_field=i, float_field=i) for i in range(3)],
+            ["int_field"],
+        )
+        results = pgbulk.upsert(
+            models.TestModel,
+            [models.TestModel(int_field=i, float_field=i + 1) for i in range(3)],
+            ["int_field"],
+            returning=True,
+        )
+        pgbulk.update(
+            models.TestModel,
+            [models.TestModel(id=result.id, char_field="updated") for result in results],
+            ["char_field"],
+        )
+
+    assert models.TestModel.objects.count() == 3
+    for test_model in models.TestModel.objects.all():
+        assert test_model.float_field == test_model.int_field + 1
+        assert test_model.char_field == "updated"
+
+
+@pytest.mark.skipif(psycopg_maj_version == 2, reason="Requires psycopg3")
+@pytest.mark.django_db
+def test_upsert_with_prepared_statements_enabled():
+    """
+    Tests that the prepared-statement threshold is only lowered when the
+    connection has preparation enabled, and is restored afterwards.
+    """
+    connection.ensure_connection()
+    original = connection.connection.prepare_threshold
+    connection.connection.prepare_threshold = 5
+    try:
+        pgbulk.upsert(
+            models.TestModel,
+            [models.TestModel(int_field=1, float_field=1)],
+            ["int_field"],
+            ["float_field"],
+        )
+        assert connection.connection.prepare_threshold == 5
+    finally:
+        connection.connection.prepare_threshold = original
+
+    assert models.TestModel.objects.count() == 1